@@ -13,6 +13,7 @@ from .data_utils import (
     fetch_satellite_data,
     fetch_satellite_sensors_data,
     fetch_all_products_data,
+    fetch_all_products_data_batch,
     process_all_products_data,
     process_satellite_sensors_data,
     make_all_products_dataframe
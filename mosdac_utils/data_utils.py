@@ -1,20 +1,152 @@
-import requests
+import atexit
+import copy
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+import httpx
+import orjson
 import pandas as pd
+from pandas.api.types import union_categoricals
+from cachetools import TTLCache
+from hishel import BaseFilter, FilterPolicy, Request, Response, SyncSqliteStorage
+from hishel.httpx import SyncCacheTransport
+
+logger = logging.getLogger(__name__)
+
+# browser User-Agent sent on every request to mosdac.gov.in, also used by `rss_utils` for the feeds
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
+)
+
+# all MOSDAC catalog endpoints expect the same browser-like headers,
+# kept as a read-only view so the shared constant cannot be mutated by accident
+_HEADERS = MappingProxyType({
+    "User-Agent": USER_AGENT,
+    "Content-Type": "application/json",
+    "Origin": "https://www.mosdac.gov.in",
+    "X-Requested-With": "XMLHttpRequest"
+})
+
+# number of concurrent fetches in `make_all_products_dataframe`, the connection pool is sized to match
+_MAX_WORKERS = 16
+
+# on-disk HTTP cache shared across notebook sessions and reruns, entries expire after 24h.
+# Kept in a fixed per-user location (override with MOSDAC_CACHE_PATH) rather than the working directory
+_HTTP_CACHE_PATH = os.environ.get(
+    "MOSDAC_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "mosdac_utils", "mosdac_cache.db")
+)
+
+
+# set per thread while `_post_req(force_refresh=True)` runs, see `_RefreshableSqliteStorage`
+_FORCE_REFRESH = threading.local()
+
+
+class _RefreshableSqliteStorage(SyncSqliteStorage):
+    """
+    SQLite cache storage where a forced refresh turns the lookup into a miss.
+    Existing entries for the request are removed, so the fresh response is stored in their place.
+    """
+
+    def get_entries(self, key):
+        entries = super().get_entries(key)
+        if getattr(_FORCE_REFRESH, "active", False):
+            for entry in entries:
+                self.remove_entry(entry.id)
+            return []
+        return entries
+
+
+class _CacheableRequestFilter(BaseFilter[Request]):
+    """Keep requests sent with `Cache-Control: no-store` out of the on-disk cache entirely."""
+
+    def needs_body(self):
+        return False
 
-def _post_req(url, headers, payload, timeout=10):
+    def apply(self, item, body):
+        return "no-store" not in item.headers.get("Cache-Control", "")
+
+
+class _OkResponseFilter(BaseFilter[Response]):
+    """Only store successful responses in the on-disk cache."""
+
+    def needs_body(self):
+        return False
+
+    def apply(self, item, body):
+        return item.status_code == 200
+
+
+# POST payloads differ only in their body, so the body is part of the cache key
+_HTTP_CACHE_POLICY = FilterPolicy(request_filters=[_CacheableRequestFilter()], response_filters=[_OkResponseFilter()])
+_HTTP_CACHE_POLICY.use_body_key = True
+
+# shared client so the TCP+TLS connection to mosdac.gov.in is reused across calls,
+# created on first use by `_get_client` so importing the package does not open the cache database
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client():
+    """
+    Internal helper returning the shared `httpx.Client`, creating it on first use.
+    Failed connection attempts are retried by the transport and responses go through the on-disk HTTP cache.
     """
-    Internal helper to perform a POST request and return parsed JSON.
+
+    global _CLIENT
+
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            os.makedirs(os.path.dirname(_HTTP_CACHE_PATH) or ".", exist_ok=True)
+            _CLIENT = httpx.Client(
+                transport=SyncCacheTransport(
+                    next_transport=httpx.HTTPTransport(
+                        http2=True,
+                        retries=3,
+                        limits=httpx.Limits(max_connections=_MAX_WORKERS, max_keepalive_connections=_MAX_WORKERS)
+                    ),
+                    storage=_RefreshableSqliteStorage(
+                        # the client is used from the `make_all_products_dataframe` thread pool
+                        connection=sqlite3.connect(_HTTP_CACHE_PATH, check_same_thread=False),
+                        default_ttl=86400
+                    ),
+                    policy=_HTTP_CACHE_POLICY
+                ),
+                timeout=10,
+                headers=_HEADERS
+            )
+            atexit.register(_CLIENT.close)
+        return _CLIENT
+
+
+# the catalog rarely changes within a day, so responses are kept in-process for 24h
+_SATELLITE_CACHE = TTLCache(maxsize=1024, ttl=86400)
+_SENSORS_CACHE = TTLCache(maxsize=1024, ttl=86400)
+_PRODUCTS_CACHE = TTLCache(maxsize=1024, ttl=86400)
+# TTLCache is not thread-safe and `make_all_products_dataframe` fetches from a thread pool
+_CACHE_LOCK = threading.Lock()
+
+
+def _post_req(url, payload, timeout=10, force_refresh=False):
+    """
+    Internal helper to perform a POST request on the shared client and return parsed JSON.
+    Responses are served from the on-disk HTTP cache when available.
 
     Parameters
     ----------
     url : str
         Endpoint URL to POST to.
-    headers : dict
-        HTTP headers for the request.
     payload : dict
         JSON payload to send in the request body.
     timeout : int, optional
         Request timeout in seconds (default 10).
+    force_refresh : bool, optional
+        If True, always hit the server and replace the on-disk HTTP cache entry with the fresh response (default False).
 
     Returns
     -------
@@ -23,19 +155,65 @@ def _post_req(url, headers, payload, timeout=10):
     """
 
     try:
-        print("Sending request...")
-        response = requests.post(url, headers=headers, json=payload, timeout=timeout, verify=True)
+        logger.debug("Sending request to %s", url)
+        _FORCE_REFRESH.active = force_refresh
+        try:
+            response = _get_client().post(url, json=payload, timeout=timeout)
+        finally:
+            _FORCE_REFRESH.active = False
         response.raise_for_status()  # handle all HTTP errors
-        print(f"Status Code: {response.status_code}")
-        print("Data received.")
-        return response.json()
-    except Exception as e:
-        print("Error during request: ", e)
+        logger.debug("Status Code: %s, data received.", response.status_code)
+        return orjson.loads(response.content)  # faster than the stdlib json behind response.json()
+    except orjson.JSONDecodeError as e:
+        logger.error("Error decoding response from %s: %s", url, e)
+        return None
+    except Exception:
+        logger.exception("Error during request to %s", url)
         return None
 
 
+def _cached_post_req(cache, key, url, payload, timeout=10, force_refresh=False):
+    """
+    Internal helper wrapping `_post_req` with a TTL cache lookup.
+    Failed requests (None) are not cached. Callers get their own copy, so mutating the result
+    does not change what later calls receive from the cache.
+
+    Parameters
+    ----------
+    cache : cachetools.TTLCache
+        Cache to look up and store the response in.
+    key : tuple
+        Hashable cache key identifying the request.
+    url : str
+        Endpoint URL to POST to.
+    payload : dict
+        JSON payload to send in the request body.
+    timeout : int, optional
+        Request timeout in seconds (default 10).
+    force_refresh : bool, optional
+        If True, skip the cache lookups and always hit the server (default False).
+
+    Returns
+    -------
+    dict or list or None
+        The parsed JSON response on success; None on failure.
+    """
+
+    if not force_refresh:
+        with _CACHE_LOCK:
+            cached = cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+    data = _post_req(url, payload, timeout=timeout, force_refresh=force_refresh)
+    if data is not None:
+        with _CACHE_LOCK:
+            cache[key] = copy.deepcopy(data)
+    return data
+
+
 # fetches satellite data doesnt work for insitu and radar as they have change in url, headers and payload
-def fetch_satellite_data(payload, timeout=10):
+def fetch_satellite_data(payload, timeout=10, force_refresh=False):
     """
     Fetch satellite records from MOSDAC's catalog API.
 
@@ -48,6 +226,8 @@ def fetch_satellite_data(payload, timeout=10):
         Request payload (as required by the API).
     timeout : int, optional
         Request timeout in seconds (default 10).
+    force_refresh : bool, optional
+        If True, bypass the in-process and on-disk caches (default False).
 
     Returns
     -------
@@ -57,17 +237,10 @@ def fetch_satellite_data(payload, timeout=10):
 
     url = "https://www.mosdac.gov.in/catalog/Search/getSatelliteData.php"
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-        "Content-Type": "application/json",
-        "Origin": "https://www.mosdac.gov.in",
-        "X-Requested-With": "XMLHttpRequest"
-    }
-    
-    return _post_req(url, headers=headers, payload=payload, timeout=timeout)
+    key = tuple(sorted(payload.items()))
+    return _cached_post_req(_SATELLITE_CACHE, key, url, payload, timeout=timeout, force_refresh=force_refresh)
 
-def fetch_satellite_sensors_data(satellite_id ,timeout=10):
+def fetch_satellite_sensors_data(satellite_id ,timeout=10, force_refresh=False):
     """
     Fetch sensor information for a given satellite.
     Note: works only for satellite, Insitu and Radar return sensor info in `fetch_satellite_data` function itself.
@@ -78,6 +251,8 @@ def fetch_satellite_sensors_data(satellite_id ,timeout=10):
         The unique satellite identifier to query.
     timeout : int, optional
         Request timeout in seconds (default 10).
+    force_refresh : bool, optional
+        If True, bypass the in-process and on-disk caches (default False).
 
     Returns
     -------
@@ -87,18 +262,12 @@ def fetch_satellite_sensors_data(satellite_id ,timeout=10):
 
     url = "https://www.mosdac.gov.in/catalog/Search/getSensorData.php"
 
-    headers = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-    "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-    "Content-Type": "application/json",
-    "Origin": "https://www.mosdac.gov.in",
-    "X-Requested-With": "XMLHttpRequest"}
-    
     payload = {
         "id": str(satellite_id)
     }
     
-    return _post_req(url, headers, payload, timeout=timeout)
+    key = (str(satellite_id),)
+    return _cached_post_req(_SENSORS_CACHE, key, url, payload, timeout=timeout, force_refresh=force_refresh)
 
 
 # a satellite may contain more than one sensor
@@ -123,34 +292,34 @@ def process_satellite_sensors_data(satellite_name, satellite_id, data):
     -------
     pd.DataFrame or None
         DataFrame with one row per sensor (columns: satellite_name, satellite_id, sensor_name, sensor_id). 
+        satellite_name and satellite_id are categorical columns.
         Returns None if `data` is falsy or processing fails.
     """
 
     if not data:
-        print(f"No sensors data for satellite_id {satellite_id}")
+        logger.debug("No sensors data for satellite_id %s", satellite_id)
         return None
     
-    # this will store the value of new dataframe
-    new_rows = []
-    
     try:
-        for sensor in data:
-            new_row = {
-                "satellite_name": str(satellite_name),
-                "satellite_id": str(satellite_id),
-                "sensor_name": str(sensor["name"]),
-                "sensor_id": str(sensor["id"])
-            }
-            new_rows.append(new_row)
-            
-        satellite_sensors_df =  pd.DataFrame(new_rows) 
+        # build the df column-wise, per-row dicts make pandas infer dtypes row by row
+        sensor_names = [str(sensor["name"]) for sensor in data]
+        sensor_ids = [str(sensor["id"]) for sensor in data]
+        # satellite columns hold a single value per call, store them as categoricals
+        codes = [0] * len(data)
+        
+        satellite_sensors_df = pd.DataFrame({
+            "satellite_name": pd.Categorical.from_codes(codes, categories=[str(satellite_name)]),
+            "satellite_id": pd.Categorical.from_codes(codes, categories=[str(satellite_id)]),
+            "sensor_name": sensor_names,
+            "sensor_id": sensor_ids
+        })
         return satellite_sensors_df  #return the DataFrame with satellite and sensor data
-    except Exception as e:
-        print(f"Error processing data for satellite {satellite_id}: {e}")
+    except Exception:
+        logger.exception("Error processing data for satellite %s", satellite_id)
         return None
 
 
-def fetch_all_products_data(satellite_id, sensor_id, timeout=10):
+def fetch_all_products_data(satellite_id, sensor_id, timeout=10, force_refresh=False):
     """
     Fetch product data for satellites sensor combination from MOSDAC's catalog API.
     This function calls the MOSDAC `getAllProductData.php` endpoint.
@@ -164,20 +333,15 @@ def fetch_all_products_data(satellite_id, sensor_id, timeout=10):
         Sensor identifier.
     timeout : int, optional
         Request timeout in seconds (default 10).
+    force_refresh : bool, optional
+        If True, bypass the in-process and on-disk caches (default False).
 
     Returns
     -------
-    post request to the server via `_post_req` function it uses `requests`.
+    post request to the server via `_post_req` function it uses the shared `httpx` client.
 
     """
     
-    headers = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-    "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-    "Content-Type": "application/json",
-    "Origin": "https://www.mosdac.gov.in",
-    "X-Requested-With": "XMLHttpRequest"}
-
     url = "https://www.mosdac.gov.in/catalog/Search/getAllProductData.php"
     
     payload = {
@@ -185,15 +349,142 @@ def fetch_all_products_data(satellite_id, sensor_id, timeout=10):
         "sensor_id": str(sensor_id)
     }
     
-    return _post_req(url, headers, payload, timeout=timeout)
+    key = (str(satellite_id), str(sensor_id))
+    return _cached_post_req(_PRODUCTS_CACHE, key, url, payload, timeout=timeout, force_refresh=force_refresh)
+
+# None until a batch request gets a definite answer: True once the server returned products tagged
+# per pair, False once it rejected the batch payload (400/422) or answered without per-pair tags.
+# Transient failures (timeouts, 5xx) leave it unchanged.
+_BATCH_SUPPORTED = None
+
+
+def _post_products_batch(pairs, timeout=10):
+    """
+    Internal helper that tries to fetch products for many pairs in a single `getAllProductData.php` request.
+    The request is sent with `Cache-Control: no-store`, so probe responses never reach the on-disk cache.
+
+    Returns
+    -------
+    dict or None
+        {(satellite_id, sensor_id): list[dict]} for the pairs present in the response, or None if the
+        request failed or the server does not support batches.
+    """
+
+    global _BATCH_SUPPORTED
+
+    url = "https://www.mosdac.gov.in/catalog/Search/getAllProductData.php"
+
+    payload = {
+        "pairs": [{"datasource_id": satellite_id, "sensor_id": sensor_id} for satellite_id, sensor_id in pairs]
+    }
+
+    try:
+        response = _get_client().post(url, json=payload, headers={"Cache-Control": "no-store"}, timeout=timeout)
+        response.raise_for_status()
+        rows = orjson.loads(response.content)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code in (400, 422):  # the endpoint only accepts one pair
+            _BATCH_SUPPORTED = False
+        logger.debug("Batch request to %s failed", url, exc_info=True)
+        return None
+    except Exception:
+        logger.debug("Batch request to %s failed", url, exc_info=True)
+        return None
+
+    # a usable batch response is a non-empty flat list of products tagged with the pair they belong to,
+    # a handler that ignores the unknown `pairs` key answers with [] or untagged rows instead
+    if not isinstance(rows, list) or not rows or not all(isinstance(row, dict) and "datasource_id" in row and "sensor_id" in row for row in rows):
+        logger.debug("Batch response from %s is not split by datasource_id/sensor_id", url)
+        _BATCH_SUPPORTED = False
+        return None
+
+    _BATCH_SUPPORTED = True
 
+    results = {}
+    for row in rows:
+        pair = (str(row["datasource_id"]), str(row["sensor_id"]))
+        # drop the tags so each entry looks like a single pair response
+        results.setdefault(pair, []).append({k: v for k, v in row.items() if k not in ("datasource_id", "sensor_id")})
+
+    return results
+
+
+def _fetch_all_products_per_pair(pairs, timeout=10, force_refresh=False):
+    """
+    Internal helper fetching each (satellite_id, sensor_id) pair with its own `fetch_all_products_data` call.
+    Requests are pure I/O, so they run in parallel on a thread pool over the shared client.
+
+    Returns
+    -------
+    dict
+        {(satellite_id, sensor_id): list[dict] or None}, None for pairs whose request failed.
+    """
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        fetched = executor.map(
+            lambda pair: fetch_all_products_data(*pair, timeout=timeout, force_refresh=force_refresh),
+            pairs
+        )
+        return dict(zip(pairs, fetched))
+
+
+def fetch_all_products_data_batch(pairs, timeout=10, force_refresh=False):
+    """
+    Fetch product data for many satellite-sensor combinations from MOSDAC's catalog API.
+    First tries a single `getAllProductData.php` request carrying all pairs. Pairs missing from its response,
+    or all pairs if the server does not accept batches, are fetched with concurrent per-pair calls.
+    Pairs already in the in-process cache are not requested again.
+
+    Parameters
+    ----------
+    pairs : list[tuple]
+        (satellite_id, sensor_id) pairs to fetch.
+    timeout : int, optional
+        Request timeout in seconds (default 10).
+    force_refresh : bool, optional
+        If True, bypass the in-process and on-disk caches (default False).
+
+    Returns
+    -------
+    dict
+        {(satellite_id, sensor_id): list[dict] or None} keyed by the ids as str,
+        None for pairs whose request failed.
+    """
+
+    pairs = list(dict.fromkeys((str(satellite_id), str(sensor_id)) for satellite_id, sensor_id in pairs))
+    results = {}
+
+    if not force_refresh:
+        with _CACHE_LOCK:
+            for pair in pairs:
+                cached = _PRODUCTS_CACHE.get(pair)
+                if cached is not None:
+                    results[pair] = copy.deepcopy(cached)
+
+    missing = [pair for pair in pairs if pair not in results]
+
+    if missing and _BATCH_SUPPORTED is not False:
+        batch = _post_products_batch(missing, timeout=timeout)
+        if batch is not None:
+            # only pairs that were asked for are returned and cached
+            missing_set = set(missing)
+            batch = {pair: products for pair, products in batch.items() if pair in missing_set}
+            with _CACHE_LOCK:
+                _PRODUCTS_CACHE.update(copy.deepcopy(batch))
+            results.update(batch)
+            missing = [pair for pair in missing if pair not in batch]
+
+    if missing:
+        results.update(_fetch_all_products_per_pair(missing, timeout=timeout, force_refresh=force_refresh))
+
+    return results
 
 
 def process_all_products_data(satellite_id, satellite_name, sensor_id, sensor_name ,data): 
     """
     
     Processes product data for a given satellite-sensor combination.
-    Adds satellite and sensor details to each product row.
+    Adds satellite and sensor details to each product row as categorical columns.
     
     Parameters
     ----------
@@ -211,21 +502,19 @@ def process_all_products_data(satellite_id, satellite_name, sensor_id, sensor_na
     """
     
     if not data:
-        print(f"No data for satellite_id: {satellite_id} & sensor_id: {sensor_id}")
+        logger.debug("No data for satellite_id: %s & sensor_id: %s", satellite_id, sensor_id)
         return None
     
     product_df = pd.DataFrame(data)
     
-    # adding new cols
-    product_df["satellite_name"] = satellite_name
-    product_df["satellite_id"] = satellite_id
-    product_df["sensor_name"] = sensor_name
-    product_df["sensor_id"] = sensor_id
+    # every row repeats the same satellite/sensor values, store them as single-category categoricals
+    codes = [0] * len(product_df)
     
-    # rearrange the cols
-    columns = product_df.columns.tolist()
-    new_order = ["satellite_name","satellite_id","sensor_name","sensor_id"] + [col for col in columns if col not in ["satellite_name","satellite_id","sensor_name","sensor_id"]] 
-    product_df = product_df[new_order]
+    # adding new cols at the front, inserted in reverse so no reorder/copy is needed afterwards
+    product_df.insert(0, "sensor_id", pd.Categorical.from_codes(codes, categories=[str(sensor_id)]))
+    product_df.insert(0, "sensor_name", pd.Categorical.from_codes(codes, categories=[str(sensor_name)]))
+    product_df.insert(0, "satellite_id", pd.Categorical.from_codes(codes, categories=[str(satellite_id)]))
+    product_df.insert(0, "satellite_name", pd.Categorical.from_codes(codes, categories=[str(satellite_name)]))
     
     return product_df 
 
@@ -233,7 +522,7 @@ def process_all_products_data(satellite_id, satellite_name, sensor_id, sensor_na
 def make_all_products_dataframe(satellite_sensors_df):
     """
     (Capsule Function)
-    Iterate over satellite-sensor pairs, fetch & process product data, and concatenate results into a single new df.
+    Fetch product data for all satellite-sensor pairs concurrently, process it and concatenate results into a single new df.
 
     Parameters
     ----------
@@ -248,25 +537,43 @@ def make_all_products_dataframe(satellite_sensors_df):
     
     all_dataframes = []
     
-    for idx, row in satellite_sensors_df.iterrows():
-        satellite_id = row["satellite_id"]
-        satellite_name = row["satellite_name"]
-        sensor_name = row["sensor_name"]
-        sensor_id = row["sensor_id"]
-        
-        data = fetch_all_products_data(satellite_id=satellite_id, sensor_id=sensor_id)
+    # plain column arrays, no per-row Series/namedtuple construction
+    satellite_ids = satellite_sensors_df["satellite_id"].values
+    satellite_names = satellite_sensors_df["satellite_name"].values
+    sensor_names = satellite_sensors_df["sensor_name"].values
+    sensor_ids = satellite_sensors_df["sensor_id"].values
+    
+    pairs = [(str(satellite_id), str(sensor_id)) for satellite_id, sensor_id in zip(satellite_ids, sensor_ids)]
+    # getAllProductData.php is only known to take one pair per call, so batches are used only once
+    # `fetch_all_products_data_batch` has seen the server accept one
+    if _BATCH_SUPPORTED:
+        results = fetch_all_products_data_batch(pairs)
+    else:
+        results = _fetch_all_products_per_pair(list(dict.fromkeys(pairs)))
+    
+    for satellite_id, satellite_name, sensor_name, sensor_id in zip(satellite_ids, satellite_names, sensor_names, sensor_ids):
+        data = results.get((str(satellite_id), str(sensor_id)))
         processed_df = process_all_products_data(satellite_id=satellite_id, satellite_name=satellite_name, sensor_id=sensor_id, sensor_name=sensor_name, data=data)
     
         if processed_df is not None:
             all_dataframes.append(processed_df)
         else:
-            print(f"dataFrame is None for satellite_id: {satellite_id} , sensor_id:{sensor_id}")
-            print("skipping this sensor")
+            logger.debug("dataFrame is None for satellite_id: %s , sensor_id: %s, skipping this sensor", satellite_id, sensor_id)
             continue
     
     if not all_dataframes:
-        print("No product data found. Returning empty DataFrame.")
+        logger.warning("No product data found. Returning empty DataFrame.")
         return pd.DataFrame()
     
-    all_products_df = pd.concat(all_dataframes, ignore_index=True)
+    # concat only keeps categoricals whose categories match, so align them first
+    for col in ("satellite_name", "satellite_id", "sensor_name", "sensor_id"):
+        categories = union_categoricals([df[col] for df in all_dataframes]).categories
+        for df in all_dataframes:
+            df[col] = df[col].cat.set_categories(categories)
+    
+    # give every frame the same column layout (first-seen order) so concat does not have to align them
+    all_columns = list(dict.fromkeys(col for df in all_dataframes for col in df.columns))
+    all_dataframes = [df.reindex(columns=all_columns) for df in all_dataframes]
+    
+    all_products_df = pd.concat(all_dataframes, ignore_index=True, sort=False)
     return all_products_df
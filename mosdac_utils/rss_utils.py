@@ -1,54 +1,180 @@
+import io
+import logging
+from itertools import chain
+from types import MappingProxyType
+
+import httpx
 import pandas as pd
-import datetime
 import feedparser
+from lxml import etree
+
+from .data_utils import USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# feeds are plain GETs, so only the browser User-Agent is sent, not the catalog's JSON/XHR headers
+_FEED_HEADERS = MappingProxyType({"User-Agent": USER_AGENT})
+
+# MOSDAC feeds have a fixed datacasting/georss schema, matching on local-name()
+# keeps the lookups independent of the exact namespace URIs each feed declares
+_XPATH_ACQ_START = etree.XPath("*[local-name()='acquisitionStartDate']/text()")
+_XPATH_PREVIEW = etree.XPath("*[local-name()='preview']/text()")
+_XPATH_LOWER_CORNER = etree.XPath(".//*[local-name()='lowerCorner']/text()")
+_XPATH_UPPER_CORNER = etree.XPath(".//*[local-name()='upperCorner']/text()")
+
+_FEED_FIELDS = ("title", "description", "pub_date", "acq_start", "preview_url", "link", "bbox_lower", "bbox_upper")
+
+
+def _parse_bbox(corners):
+    """
+    Internal helper to parse whitespace separated gml corner strings into lists of floats.
+    All values are converted to float in one vectorized pass, then sliced back per corner,
+    so each corner keeps its own number of values (no NaN padding).
+    Missing (falsy) corners are returned unchanged.
+    """
+
+    parsed_corners = list(corners)
+    present = [i for i, corner in enumerate(corners) if corner]
+
+    if present:
+        tokens = [corners[i].split() for i in present]
+        values = pd.Series(list(chain.from_iterable(tokens)), dtype=object).astype(float).tolist()
+        start = 0
+        for i, corner_tokens in zip(present, tokens):
+            end = start + len(corner_tokens)
+            parsed_corners[i] = values[start:end]
+            start = end
+
+    return parsed_corners
+
+
+def _first_text(values):
+    """Internal helper returning the first xpath text match stripped, or None like feedparser does for missing fields."""
+
+    return values[0].strip() if values else None
+
+
+def _child_text(item, tag):
+    """Internal helper returning the stripped text of a direct child of `item`, or None if missing or empty."""
+
+    return (item.findtext(tag) or "").strip() or None
+
+
+def _read_feed_lxml(url, timeout=10):
+    """
+    Internal helper to stream the `<item>` elements of a feed with `lxml.etree.iterparse`.
+    Remote feeds are downloaded with httpx using the same browser User-Agent as the catalog requests.
+    Text fields are stripped of surrounding whitespace, as `feedparser` does.
+
+    Returns
+    -------
+    dict[str, list]
+        One list of raw strings per name in `_FEED_FIELDS`.
+    """
+
+    # collected column-wise instead of one dict per entry
+    columns = {field: [] for field in _FEED_FIELDS}
+
+    if url.startswith(("http://", "https://")):
+        response = httpx.get(url, headers=_FEED_HEADERS, timeout=timeout, follow_redirects=True)
+        response.raise_for_status()
+        source = io.BytesIO(response.content)
+    else:
+        source = url
+
+    for _, item in etree.iterparse(source, events=("end",), tag="item"):
+        columns["title"].append(_child_text(item, "title"))
+        columns["description"].append(_child_text(item, "description"))
+        columns["pub_date"].append(_child_text(item, "pubDate"))
+        columns["acq_start"].append(_first_text(_XPATH_ACQ_START(item)))
+        columns["preview_url"].append(_first_text(_XPATH_PREVIEW(item)))
+        columns["link"].append(_child_text(item, "link"))
+        columns["bbox_lower"].append(_first_text(_XPATH_LOWER_CORNER(item)))
+        columns["bbox_upper"].append(_first_text(_XPATH_UPPER_CORNER(item)))
+        # free the parsed item, only the extracted strings are kept
+        item.clear()
+
+    return columns
+
+
+def _read_feed_feedparser(url):
+    """
+    Internal helper to read a feed with `feedparser`, the fallback for feeds `_read_feed_lxml` cannot handle.
+
+    Returns
+    -------
+    dict[str, list]
+        One list of raw strings per name in `_FEED_FIELDS`.
+    """
+
+    feed = feedparser.parse(url)
+
+    columns = {field: [] for field in _FEED_FIELDS}
+
+    for entry in feed.entries:
+        columns["title"].append(entry.get("title"))
+        columns["description"].append(entry.get("description"))
+        columns["pub_date"].append(entry.get("published"))
+        columns["acq_start"].append(entry.get("datacasting_acquisitionstartdate"))
+        columns["preview_url"].append(entry.get("datacasting_preview"))
+        columns["link"].append(entry.get("link"))
+        columns["bbox_lower"].append(entry.get("gml_lowercorner"))
+        columns["bbox_upper"].append(entry.get("gml_uppercorner"))
+
+    return columns
+
+
+def rss_scraper(url, parse_bbox=True, use_feedparser=False, timeout=10):
+    """
+    Scrape a MOSDAC datacasting RSS feed into a DataFrame, one row per feed entry.
+    The feed is parsed with `lxml` by default.
+
+    Parameters
+    ----------
+    url : str
+        URL (or local path) of the RSS feed.
+    parse_bbox : bool, optional
+        If True (default), bbox_lower/bbox_upper are lists of floats.
+        If False, they are kept as the raw "lat lon" strings from the feed and parsing is skipped.
+    use_feedparser : bool, optional
+        If True, parse the feed with `feedparser` instead of `lxml` (default False).
+    timeout : int, optional
+        Download timeout in seconds for the `lxml` path (default 10).
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Columns: product_id, title, description, pub_date, acq_start, preview_url, link, bbox_lower, bbox_upper.
+        Returns None if the feed has no entries or scraping fails.
+    """
 
-def rss_scraper(url):
     try:
-        feed = feedparser.parse(url)
+        columns = _read_feed_feedparser(url) if use_feedparser else _read_feed_lxml(url, timeout=timeout)
 
-        if not feed.entries:
-            print("No entries found in feed")
+        if not columns["title"]:
+            logger.warning("No entries found in feed %s", url)
             return
-        
-        all_data = []
-
-        for entry in feed.entries:
-            title = entry.get("title")
-            description = entry.get("description")
-            pub_date = entry.get("published")
-            acq_start = entry.get("datacasting_acquisitionstartdate")
-
-            acq_dt = datetime.datetime.strptime(acq_start, "%a, %d %b %Y %H:%M:%S %Z")
-            acq_str = acq_dt.strftime("%Y-%m-%dT%H-%M-%S")  
-
-            product_id = f"{title}_{acq_str}"
-
-            preview_url = entry.get("datacasting_preview")
-            link = entry.get("link")
-            bbox_lower = entry.get("gml_lowercorner")
-            bbox_upper = entry.get("gml_uppercorner")
-
-            if bbox_lower:
-                bbox_lower = list(map(float, bbox_lower.split())) 
-            if bbox_upper:
-                bbox_upper = list(map(float, bbox_upper.split()))
-            
-            data = {
-                "product_id":product_id,
-                "title":title,
-                "description":description,
-                "pub_date":pub_date,
-                "acq_start":acq_start,
-                "preview_url":preview_url,
-                "link":link,
-                "bbox_lower":bbox_lower,
-                "bbox_upper":bbox_upper
-            }
-            
-            all_data.append(data)
-
-        df = pd.DataFrame(all_data)
-        print("df sucessfully created.")
+
+        # raw dates, parsed in one go
+        acq_dts = pd.to_datetime(columns["acq_start"], format="%a, %d %b %Y %H:%M:%S %Z", utc=True)
+        product_ids = pd.Index(columns["title"]) + "_" + acq_dts.strftime("%Y-%m-%dT%H-%M-%S")
+
+        # raw "lat lon" strings, parsed in one go if `parse_bbox`
+        bbox_lowers = columns["bbox_lower"]
+        bbox_uppers = columns["bbox_upper"]
+
+        df = pd.DataFrame({
+            "product_id":product_ids,
+            "title":columns["title"],
+            "description":columns["description"],
+            "pub_date":columns["pub_date"],
+            "acq_start":columns["acq_start"],
+            "preview_url":columns["preview_url"],
+            "link":columns["link"],
+            "bbox_lower":_parse_bbox(bbox_lowers) if parse_bbox else bbox_lowers,
+            "bbox_upper":_parse_bbox(bbox_uppers) if parse_bbox else bbox_uppers
+        })
+        logger.debug("df sucessfully created.")
         return df
-    except Exception as e:
-        print("error: ",e)
\ No newline at end of file
+    except Exception:
+        logger.exception("Error scraping rss feed %s", url)
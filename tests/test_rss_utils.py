@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from mosdac_utils.rss_utils import rss_scraper
+
+# one item laid out the way pretty-printed feeds are, every text field wrapped in indentation
+_INDENTED_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+     xmlns:datacasting="http://datacasting.jpl.nasa.gov/datacasting"
+     xmlns:georss="http://www.georss.org/georss"
+     xmlns:gml="http://www.opengis.net/gml">
+  <channel>
+    <title>INSAT-3D Imager</title>
+    <item>
+      <title>
+        3DIMG_L2G_IMR
+      </title>
+      <description>
+        Imager L2G product
+      </description>
+      <pubDate>
+        Tue, 23 Aug 2022 09:00:00 GMT
+      </pubDate>
+      <link>
+        https://www.mosdac.gov.in/3DIMG_L2G_IMR
+      </link>
+      <datacasting:acquisitionStartDate>
+        Tue, 23 Aug 2022 08:30:00 GMT
+      </datacasting:acquisitionStartDate>
+      <datacasting:preview>
+        https://www.mosdac.gov.in/preview/3DIMG_L2G_IMR.jpg
+      </datacasting:preview>
+      <georss:where>
+        <gml:Envelope>
+          <gml:lowerCorner>
+            -10.0 44.5
+          </gml:lowerCorner>
+          <gml:upperCorner>
+            45.5 105.5
+          </gml:upperCorner>
+        </gml:Envelope>
+      </georss:where>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+class RssScraperTest(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".xml")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(_INDENTED_FEED)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_readers_agree_on_indented_text(self):
+        df_lxml = rss_scraper(self.path)
+        df_feedparser = rss_scraper(self.path, use_feedparser=True)
+
+        self.assertEqual(df_lxml.loc[0, "product_id"], "3DIMG_L2G_IMR_2022-08-23T08-30-00")
+        self.assertEqual(df_lxml.loc[0, "bbox_lower"], [-10.0, 44.5])
+        pd.testing.assert_frame_equal(df_lxml, df_feedparser)
+
+
+if __name__ == "__main__":
+    unittest.main()